@@ -1,25 +1,33 @@
 import requests
-import time
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 # Create directory if it doesn't exist
 os.makedirs('downloads/images', exist_ok=True)
 
-# Download 10 images
-for i in range(1, 11):
+# One keep-alive session shared by all workers (single TLS handshake)
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+
+def fetch(i):
     url = 'https://picsum.photos/400/300'
     filename = f'downloads/images/img_{i:03d}.jpg'
-    
+
     print(f'Downloading image {i}/10...')
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    
-    with open(filename, 'wb') as f:
-        f.write(response.content)
+    with session.get(url, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        # Decode any transfer compression and write in 64 KB chunks
+        response.raw.decode_content = True
+        with open(filename, 'wb') as f:
+            shutil.copyfileobj(response.raw, f, 64 * 1024)
     print(f'Saved: {filename}')
-    
-    # Sleep 2 seconds between downloads (except after the last one)
-    if i < 10:
-        time.sleep(2)
+
+
+# Download 10 images; all requests hit picsum.photos, so cap workers to stay polite
+with ThreadPoolExecutor(max_workers=4) as executor:
+    list(executor.map(fetch, range(1, 11)))
 
 print('All images downloaded successfully!')
@@ -5,17 +5,22 @@ Extracts all books from 50 pages with title, price, rating, and availability.
 Uses only standard library modules.
 """
 
+import gzip
 import urllib.request
 import urllib.error
 import re
 import csv
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 # Configuration
 BASE_URL = "https://books.toscrape.com"
 OUTPUT_PATH = "/home/node/.openclaw/workspace/exports/books.csv"
 MAX_PAGES = 50
+MAX_WORKERS = 8
+CSV_FIELDS = ('title', 'price', 'rating', 'availability')
 
 # Rating mapping from class name to number
 RATING_MAP = {
@@ -26,61 +31,72 @@ RATING_MAP = {
     'Five': 5
 }
 
+# Precompiled patterns for parse_books
+_BOOK_RE = re.compile(r'<article[^>]*class="product_pod"[^>]*>(.*?)</article>', re.DOTALL)
+_TITLE_RE = re.compile(r'<h3>.*?<a[^>]*title="([^"]+)"', re.DOTALL)
+_PRICE_RE = re.compile(r'<p[^>]*class="price_color"[^>]*>(.*?)</p>')
+_RATING_RE = re.compile(r'<p[^>]*class="star-rating ([^"]+)"')
+_TAGS_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_AVAIL_RE = re.compile(r'<p[^>]*class="instock availability"[^>]*>\s*(?:<i[^>]*>\s*</i>)?(.*?)</p>', re.DOTALL)
+
 def fetch_page(url):
     """Fetch page content using urllib."""
     try:
         headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip'
         }
         req = urllib.request.Request(url, headers=headers)
         with urllib.request.urlopen(req, timeout=30) as response:
-            return response.read().decode('utf-8')
+            raw = response.read()
+            if response.headers.get('Content-Encoding') == 'gzip':
+                raw = gzip.decompress(raw)
+            return raw.decode('utf-8')
     except urllib.error.URLError as e:
         print(f"Error fetching {url}: {e}")
         return None
 
 def extract_rating(star_class):
     """Extract rating number from star class string."""
-    for word, num in RATING_MAP.items():
-        if word in star_class:
-            return num
-    return 0
+    words = star_class.split()
+    return RATING_MAP.get(words[-1], 0) if words else 0
 
 def parse_books(html):
     """Parse HTML and extract book data using regex."""
     books = []
     
-    # Pattern to match book article blocks
-    book_pattern = r'<article[^>]*class="product_pod"[^>]*>(.*?)</article>'
-    book_blocks = re.findall(book_pattern, html, re.DOTALL)
-    
-    for block in book_blocks:
+    # Iterate over book article blocks
+    for book_match in _BOOK_RE.finditer(html):
+        block = book_match.group(1)
         try:
             # Extract title from the <a> tag in h3
-            title_match = re.search(r'<h3>.*?<a[^>]*title="([^"]+)"', block, re.DOTALL)
+            title_match = _TITLE_RE.search(block)
             title = title_match.group(1) if title_match else "Unknown"
             
             # Extract price
-            price_match = re.search(r'<p[^>]*class="price_color"[^>]*>(.*?)</p>', block)
+            price_match = _PRICE_RE.search(block)
             price = price_match.group(1).strip() if price_match else ""
-            # Remove HTML tags from price
-            price = re.sub(r'<[^>]+>', '', price)
+            # Remove any HTML tags from price (the cell is normally plain text)
+            if '<' in price:
+                price = _WS_RE.sub(' ', _TAGS_RE.sub('', price)).strip()
             
             # Extract rating from star-rating class
-            rating_match = re.search(r'<p[^>]*class="star-rating ([^"]+)"', block)
+            rating_match = _RATING_RE.search(block)
             if rating_match:
                 rating_class = rating_match.group(1)
                 rating = extract_rating(rating_class)
             else:
                 rating = 0
             
-            # Extract availability
-            avail_match = re.search(r'<p[^>]*class="instock availability"[^>]*>(.*?)</p>', block, re.DOTALL)
+            # Extract availability (skipping the leading <i class="icon-ok"> tag)
+            avail_match = _AVAIL_RE.search(block)
             if avail_match:
                 availability = avail_match.group(1)
-                # Remove HTML tags and clean whitespace
-                availability = re.sub(r'<[^>]+>', '', availability)
-                availability = ' '.join(availability.split())
+                # Remove any markup left after the icon, then clean whitespace
+                if '<' in availability:
+                    availability = _TAGS_RE.sub('', availability)
+                availability = _WS_RE.sub(' ', availability).strip()
             else:
                 availability = "Unknown"
             
@@ -96,14 +112,15 @@ def parse_books(html):
     
     return books
 
+def page_url(page_num):
+    """Build the catalogue URL for a page number."""
+    if page_num == 1:
+        return f"{BASE_URL}/index.html"
+    return f"{BASE_URL}/catalogue/page-{page_num}.html"
+
 def scrape_page(page_num):
     """Scrape a single page and return list of book data."""
-    if page_num == 1:
-        url = f"{BASE_URL}/index.html"
-    else:
-        url = f"{BASE_URL}/catalogue/page-{page_num}.html"
-    
-    html = fetch_page(url)
+    html = fetch_page(page_url(page_num))
     if html is None:
         return []
     
@@ -116,6 +133,7 @@ def main():
     print("=" * 60)
     print(f"Output path: {OUTPUT_PATH}")
     print(f"Max pages: {MAX_PAGES}")
+    print(f"Workers: {MAX_WORKERS}")
     print("=" * 60)
     
     # Ensure output directory exists
@@ -124,23 +142,21 @@ def main():
     all_books = []
     start_time = time.time()
     
-    for page in range(1, MAX_PAGES + 1):
-        print(f"[Page {page:2d}/{MAX_PAGES}] Scraping...", end=" ")
-        books = scrape_page(page)
-        all_books.extend(books)
-        print(f"Found {len(books)} books (Total: {len(all_books)})")
-        
-        # Small delay to be polite to the server
-        if page < MAX_PAGES:
-            time.sleep(0.3)
+    # Fetch pages concurrently; the bounded pool keeps us polite to the server
+    # and map() yields results in page order so output stays deterministic
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pages = executor.map(scrape_page, range(1, MAX_PAGES + 1))
+        for page, books in enumerate(pages, 1):
+            all_books.extend(books)
+            print(f"[Page {page:2d}/{MAX_PAGES}] Found {len(books)} books (Total: {len(all_books)})")
     
     elapsed_time = time.time() - start_time
     
     # Write to CSV
     with open(OUTPUT_PATH, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['title', 'price', 'rating', 'availability'])
-        writer.writeheader()
-        writer.writerows(all_books)
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        writer.writerows(map(itemgetter(*CSV_FIELDS), all_books))
     
     print("=" * 60)
     print("✓ SCRAPING COMPLETE!")
@@ -0,0 +1,109 @@
+"""Shared OpenRouter chat-completions client for the forge scripts."""
+import gzip
+import http.client
+import json
+import os
+
+API_HOST = "openrouter.ai"
+API_PATH = "/api/v1/chat/completions"
+API_URL = f"https://{API_HOST}{API_PATH}"
+REFERER = "https://back.pulpouplatform.com"
+
+# One keep-alive connection per process, opened lazily on first call
+_conn = None
+_conn_reused = False
+
+
+class OpenRouterError(Exception):
+    """Raised when a request to OpenRouter cannot be completed."""
+
+
+class HTTPError(OpenRouterError):
+    """Raised when OpenRouter answers with a non-200 status."""
+
+    def __init__(self, code, body):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+        self.body = body
+
+
+def _post(body, headers, timeout):
+    """POST body chunks on the shared connection; returns (status, raw_bytes)."""
+    global _conn, _conn_reused
+    while True:
+        if _conn is None:
+            _conn = http.client.HTTPSConnection(API_HOST, 443, timeout=timeout)
+            _conn_reused = False
+        # Apply this call's timeout even when reusing an open connection
+        _conn.timeout = timeout
+        if _conn.sock is not None:
+            _conn.sock.settimeout(timeout)
+        reused = _conn_reused
+        try:
+            _conn.request("POST", API_PATH, body=body, headers=headers)
+            resp = _conn.getresponse()
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+            _conn.close()
+            _conn = None
+            # An idle keep-alive socket was dropped before any response bytes
+            # arrived, so the request never reached the server: retry once fresh.
+            # Timeouts are never retried since the completion may be in flight.
+            if reused:
+                continue
+            raise OpenRouterError(f"Connection failed: {e}") from e
+        except (OSError, http.client.HTTPException) as e:
+            _conn.close()
+            _conn = None
+            raise OpenRouterError(f"Connection failed: {e}") from e
+        try:
+            # Drain the body so the connection can be reused
+            raw = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            _conn.close()
+            _conn = None
+            raise OpenRouterError(f"Connection failed: {e}") from e
+        _conn_reused = True
+        if resp.will_close:
+            _conn.close()
+            _conn = None
+        if resp.getheader("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        return resp.status, raw
+
+
+def _encode_body(model, messages, temperature, max_tokens, response_format):
+    """Return the JSON request body as a list of byte chunks.
+
+    Only ``messages`` can be large, so it is serialized on its own and
+    spliced between a small prefix and suffix; sending the chunks as-is
+    avoids building one more full copy of the body.
+    """
+    tail = {"temperature": temperature, "max_tokens": max_tokens}
+    if response_format:
+        tail["response_format"] = response_format
+    prefix = '{"model": ' + json.dumps(model) + ', "messages": '
+    suffix = ", " + json.dumps(tail)[1:]
+    return [prefix.encode("utf-8"), json.dumps(messages).encode("utf-8"), suffix.encode("utf-8")]
+
+
+def chat(model, messages, temperature=0.7, max_tokens=4096, response_format=None,
+         timeout=120, api_key=None, title="OpenClaw Forge"):
+    """Send a chat completion request and return the decoded JSON response."""
+    api_key = api_key or os.environ.get("OPENROUTER_API_KEY")
+    if not api_key:
+        raise OpenRouterError("OPENROUTER_API_KEY not set")
+
+    body = _encode_body(model, messages, temperature, max_tokens, response_format)
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Content-Length": str(sum(len(chunk) for chunk in body)),
+        "Accept-Encoding": "gzip",
+        "HTTP-Referer": REFERER,
+        "X-Title": title,
+    }
+
+    status, raw = _post(body, headers, timeout)
+    if status != 200:
+        raise HTTPError(status, raw.decode("utf-8", errors="replace"))
+    return json.loads(raw)
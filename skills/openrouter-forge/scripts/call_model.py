@@ -4,10 +4,8 @@ import argparse
 import json
 import os
 import sys
-import urllib.request
-import urllib.error
 
-API_URL = "https://openrouter.ai/api/v1/chat/completions"
+from _openrouter import HTTPError, OpenRouterError, chat
 
 
 def main():
@@ -31,9 +29,9 @@ def main():
     user_content = args.prompt
     if args.input:
         try:
+            # Join straight from the read so only one large string stays alive
             with open(args.input, "r") as f:
-                file_content = f.read()
-            user_content = f"{args.prompt}\n\n---\n\n{file_content}"
+                user_content = "".join((args.prompt, "\n\n---\n\n", f.read()))
         except FileNotFoundError:
             print(f"Error: Input file not found: {args.input}", file=sys.stderr)
             sys.exit(1)
@@ -44,36 +42,18 @@ def main():
         messages.append({"role": "system", "content": args.system})
     messages.append({"role": "user", "content": user_content})
 
-    # Build request body
-    body = {
-        "model": args.model,
-        "messages": messages,
-        "temperature": args.temperature,
-        "max_tokens": args.max_tokens,
-    }
-    if args.json:
-        body["response_format"] = {"type": "json_object"}
-
-    data = json.dumps(body).encode("utf-8")
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://back.pulpouplatform.com",
-        "X-Title": "OpenClaw Forge",
-    }
-
-    req = urllib.request.Request(API_URL, data=data, headers=headers, method="POST")
+    response_format = {"type": "json_object"} if args.json else None
 
     try:
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8", errors="replace")
+        result = chat(args.model, messages, temperature=args.temperature,
+                      max_tokens=args.max_tokens, response_format=response_format,
+                      api_key=api_key)
+    except HTTPError as e:
         print(f"Error: HTTP {e.code} from OpenRouter", file=sys.stderr)
-        print(error_body[:500], file=sys.stderr)
+        print(e.body[:500], file=sys.stderr)
         sys.exit(1)
-    except urllib.error.URLError as e:
-        print(f"Error: Connection failed: {e.reason}", file=sys.stderr)
+    except OpenRouterError as e:
+        print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
     # Extract response text
@@ -61,56 +61,79 @@ python3 {{baseDir}}/scripts/run.py --input "your input" --output result.txt
     with open(os.path.join(skill_dir, "SKILL.md"), "w") as f:
         f.write(skill_md)
 
-    # Write run.py script
+    # Write run.py script; it uses the shared _openrouter client from the
+    # openrouter-forge skill installed next to it, found at run time so the
+    # tool keeps working if the workspace moves
     run_py = f'''#!/usr/bin/env python3
 """Auto-generated mini-tool: {args.name}"""
 import argparse
 import json
 import os
 import sys
-import urllib.request
 import urllib.error
+import urllib.request
+
+# Shared OpenRouter client from the sibling openrouter-forge skill
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "..", "openrouter-forge", "scripts"))
+try:
+    from _openrouter import HTTPError, OpenRouterError, chat
+except ImportError:
+    # openrouter-forge not installed alongside: minimal urllib client
+    class OpenRouterError(Exception):
+        pass
+
+    class HTTPError(OpenRouterError):
+        def __init__(self, code, body):
+            super().__init__(f"HTTP {{code}}")
+            self.code = code
+            self.body = body
+
+    def chat(model, messages, temperature=0.7, max_tokens=4096, timeout=120,
+             title="OpenClaw Forge"):
+        api_key = os.environ.get("OPENROUTER_API_KEY")
+        if not api_key:
+            raise OpenRouterError("OPENROUTER_API_KEY not set")
+        body = json.dumps({{"model": model, "messages": messages,
+                           "temperature": temperature, "max_tokens": max_tokens}}).encode("utf-8")
+        headers = {{
+            "Authorization": f"Bearer {{api_key}}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://back.pulpouplatform.com",
+            "X-Title": title,
+        }}
+        req = urllib.request.Request("https://openrouter.ai/api/v1/chat/completions",
+                                     data=body, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                return json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            raise HTTPError(e.code, e.read().decode("utf-8", errors="replace")) from e
+        except (OSError, ValueError) as e:
+            raise OpenRouterError(f"Connection failed: {{e}}") from e
 
 MODEL = "{args.model}"
 SYSTEM = """{args.system}"""
-API_URL = "https://openrouter.ai/api/v1/chat/completions"
 
 
 def call_model(user_input):
-    api_key = os.environ.get("OPENROUTER_API_KEY")
-    if not api_key:
-        print("Error: OPENROUTER_API_KEY not set", file=sys.stderr)
-        sys.exit(1)
-
-    body = json.dumps({{
-        "model": MODEL,
-        "messages": [
-            {{"role": "system", "content": SYSTEM}},
-            {{"role": "user", "content": user_input}},
-        ],
-        "temperature": 0.7,
-        "max_tokens": 4096,
-    }}).encode("utf-8")
-
-    headers = {{
-        "Authorization": f"Bearer {{api_key}}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://back.pulpouplatform.com",
-        "X-Title": "OpenClaw - {args.name}",
-    }}
-
-    req = urllib.request.Request(API_URL, data=body, headers=headers, method="POST")
+    messages = [
+        {{"role": "system", "content": SYSTEM}},
+        {{"role": "user", "content": user_input}},
+    ]
     try:
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
-        content = result["choices"][0]["message"]["content"]
-        usage = result.get("usage", {{}})
-        print(f"[{{MODEL}}] {{usage.get(\'prompt_tokens\', \'?\')}} in / {{usage.get(\'completion_tokens\', \'?\')}} out", file=sys.stderr)
-        return content
-    except urllib.error.HTTPError as e:
+        result = chat(MODEL, messages, title="OpenClaw - {args.name}")
+    except HTTPError as e:
         print(f"Error: HTTP {{e.code}}", file=sys.stderr)
-        print(e.read().decode("utf-8", errors="replace")[:300], file=sys.stderr)
+        print(e.body[:300], file=sys.stderr)
+        sys.exit(1)
+    except OpenRouterError as e:
+        print(f"Error: {{e}}", file=sys.stderr)
         sys.exit(1)
+    content = result["choices"][0]["message"]["content"]
+    usage = result.get("usage", {{}})
+    print(f"[{{MODEL}}] {{usage.get(\'prompt_tokens\', \'?\')}} in / {{usage.get(\'completion_tokens\', \'?\')}} out", file=sys.stderr)
+    return content
 
 
 def main():
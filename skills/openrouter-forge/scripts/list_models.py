@@ -1,13 +1,52 @@
 #!/usr/bin/env python3
 """List available models from OpenRouter catalog."""
 import argparse
+import gzip
+import heapq
 import json
 import os
 import sys
+import tempfile
+import time
 import urllib.request
 import urllib.error
+from pathlib import Path
 
 MODELS_URL = "https://openrouter.ai/api/v1/models"
+CACHE_TTL = 15 * 60  # seconds
+
+
+def cache_path():
+    """Location of the on-disk catalog cache."""
+    base = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return Path(base) / "openrouter" / "models.json"
+
+
+def read_cache(path):
+    """Return the cached catalog if fresh and decodable, else None."""
+    try:
+        if time.time() - path.stat().st_mtime < CACHE_TTL:
+            return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def write_cache(path, raw):
+    """Atomically store catalog bytes; caching is best-effort."""
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, path)
+    except OSError:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
 
 
 def format_price(price_str):
@@ -32,18 +71,31 @@ def main():
     args = parser.parse_args()
 
     api_key = os.environ.get("OPENROUTER_API_KEY", "")
-    headers = {"Content-Type": "application/json"}
+    headers = {"Content-Type": "application/json", "Accept-Encoding": "gzip"}
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
 
-    req = urllib.request.Request(MODELS_URL, headers=headers)
-
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
-    except (urllib.error.HTTPError, urllib.error.URLError) as e:
-        print(f"Error fetching models: {e}", file=sys.stderr)
-        sys.exit(1)
+    cache = cache_path()
+    result = read_cache(cache)
+    if result is None:
+        req = urllib.request.Request(MODELS_URL, headers=headers)
+
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                raw = resp.read()
+                if resp.headers.get("Content-Encoding") == "gzip":
+                    raw = gzip.decompress(raw)
+        except (urllib.error.HTTPError, urllib.error.URLError) as e:
+            print(f"Error fetching models: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        try:
+            result = json.loads(raw)
+        except ValueError as e:
+            print(f"Error: Invalid JSON from OpenRouter: {e}", file=sys.stderr)
+            sys.exit(1)
+        # Only cache a catalog that actually parsed
+        write_cache(cache, raw)
 
     models = result.get("data", [])
 
@@ -52,16 +104,16 @@ def main():
         q = args.filter.lower()
         models = [m for m in models if q in m.get("id", "").lower() or q in m.get("name", "").lower()]
 
-    # Sort
+    # Sort (nsmallest evaluates price_key once per model and keeps only top N)
     if args.cheap:
         def price_key(m):
             try:
                 return float(m.get("pricing", {}).get("prompt", "999"))
             except (ValueError, TypeError):
                 return 999
-        models.sort(key=price_key)
-
-    models = models[:args.top]
+        models = heapq.nsmallest(args.top, models, key=price_key)
+    else:
+        models = models[:args.top]
 
     if args.json:
         out = []
@@ -5,14 +5,44 @@ Usage: python3 sports_rss_fetcher.py [--output FILE] [--limit N]
 """
 
 import argparse
-import xml.etree.ElementTree as ET
+import gzip
+import heapq
 import urllib.request
 import urllib.error
+import io
 import json
+import socket
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from urllib.parse import urlparse
 from typing import List, Dict, Optional
 
+
+# Prefer libxml2 (lxml) for parsing; fall back to the stdlib parser
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer a keep-alive requests.Session; fall back to plain urllib
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+FETCH_ERRORS = (urllib.error.URLError,)
+if requests is not None:
+    FETCH_ERRORS += (requests.RequestException,)
+
 # RSS Feed URLs for sports news
 RSS_FEEDS = {
     'espn': 'https://www.espn.com/espn/rss/news',
@@ -23,19 +53,52 @@ RSS_FEEDS = {
     'transfermarkt': 'https://www.transfermarkt.com/rss/news',
 }
 
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+def _resolve(url: str):
+    """Resolve a feed host so the OS resolver cache is warm; errors surface later"""
+    parts = urlparse(url)
+    try:
+        socket.getaddrinfo(parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+    except OSError:
+        pass
+
+def _prewarm_dns():
+    """Resolve all feed hosts in parallel before the fetch wave starts"""
+    urls = {urlparse(u).hostname: u for u in RSS_FEEDS.values()}.values()
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        list(executor.map(_resolve, urls))
+
 class SportsRSSFetcher:
     def __init__(self):
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': 'gzip'
         }
+        # Keep-alive session: ESPN and BBC each serve two feeds from one host
+        self.session = None
+        if requests is not None:
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+            adapter = HTTPAdapter(pool_connections=len(RSS_FEEDS), pool_maxsize=2 * len(RSS_FEEDS))
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
     
     def fetch_feed(self, url: str) -> Optional[str]:
         """Fetch RSS feed content from URL"""
         try:
-            req = urllib.request.Request(url, headers=self.headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                return response.read().decode('utf-8', errors='ignore')
-        except urllib.error.URLError as e:
+            if self.session is not None:
+                response = self.session.get(url, timeout=10)
+                response.raise_for_status()
+                raw = response.content
+            else:
+                req = urllib.request.Request(url, headers=self.headers)
+                with urllib.request.urlopen(req, timeout=10) as response:
+                    raw = response.read()
+                    if response.headers.get('Content-Encoding') == 'gzip':
+                        raw = gzip.decompress(raw)
+            return raw.decode('utf-8', errors='ignore')
+        except FETCH_ERRORS as e:
             print(f"Error fetching {url}: {e}", file=sys.stderr)
             return None
         except Exception as e:
@@ -46,32 +109,50 @@ class SportsRSSFetcher:
         """Parse RSS XML content and extract articles"""
         articles = []
         try:
-            root = ET.fromstring(xml_content)
+            if HAVE_LXML:
+                # Feeds are untrusted: never resolve entities or hit the network
+                events = ET.iterparse(io.BytesIO(xml_content.encode('utf-8')), events=('end',),
+                                      encoding='utf-8', resolve_entities=False,
+                                      no_network=True, huge_tree=False)
+            else:
+                events = ET.iterparse(io.StringIO(xml_content), events=('end',))
             
-            # Handle RSS 2.0
-            for item in root.findall('.//item'):
-                article = self._extract_item_data(item)
-                if article:
-                    articles.append(article)
-            
-            # Handle Atom feeds
-            for entry in root.findall('.//{http://www.w3.org/2005/Atom}entry'):
-                article = self._extract_atom_data(entry)
+            # Single streaming pass handles both RSS 2.0 items and Atom entries
+            for _, elem in events:
+                if elem.tag == 'item':
+                    article = self._extract_item_data(elem)
+                elif elem.tag == ATOM_NS + 'entry':
+                    article = self._extract_atom_data(elem)
+                else:
+                    continue
                 if article:
                     articles.append(article)
+                # Release the subtree once its data has been extracted
+                elem.clear()
                     
         except ET.ParseError as e:
             print(f"Error parsing XML: {e}", file=sys.stderr)
+            # A malformed feed yields nothing, not the items before the error
+            articles = []
         
         return articles
     
+    @staticmethod
+    def _child_map(elem) -> Dict:
+        """Map each child tag to its first matching child element"""
+        children = {}
+        for child in elem:
+            children.setdefault(child.tag, child)
+        return children
+    
     def _extract_item_data(self, item) -> Optional[Dict]:
         """Extract data from RSS item"""
         try:
-            title = item.find('title')
-            link = item.find('link')
-            description = item.find('description')
-            pub_date = item.find('pubDate')
+            children = self._child_map(item)
+            title = children.get('title')
+            link = children.get('link')
+            description = children.get('description')
+            pub_date = children.get('pubDate')
             
             return {
                 'title': title.text if title is not None else 'No title',
@@ -86,11 +167,11 @@ class SportsRSSFetcher:
     def _extract_atom_data(self, entry) -> Optional[Dict]:
         """Extract data from Atom entry"""
         try:
-            ns = {'atom': 'http://www.w3.org/2005/Atom'}
-            title = entry.find('atom:title', ns)
-            link = entry.find('atom:link', ns)
-            summary = entry.find('atom:summary', ns)
-            updated = entry.find('atom:updated', ns)
+            children = self._child_map(entry)
+            title = children.get(ATOM_NS + 'title')
+            link = children.get(ATOM_NS + 'link')
+            summary = children.get(ATOM_NS + 'summary')
+            updated = children.get(ATOM_NS + 'updated')
             
             href = link.get('href') if link is not None else ''
             
@@ -107,19 +188,26 @@ class SportsRSSFetcher:
     def fetch_all(self, limit: int = 10) -> List[Dict]:
         """Fetch and combine articles from all feeds"""
         all_articles = []
+        _prewarm_dns()
         
-        for source, url in RSS_FEEDS.items():
-            print(f"Fetching from {source}...", file=sys.stderr)
-            content = self.fetch_feed(url)
-            if content:
-                articles = self.parse_rss(content)
-                for article in articles:
-                    article['feed_source'] = source
-                all_articles.extend(articles)
+        # Feeds live on different hosts, so fetch them all at once
+        with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as executor:
+            future_to_source = {}
+            for source, url in RSS_FEEDS.items():
+                print(f"Fetching from {source}...", file=sys.stderr)
+                future_to_source[executor.submit(self.fetch_feed, url)] = source
+            
+            for future in as_completed(future_to_source):
+                source = future_to_source[future]
+                content = future.result()
+                if content:
+                    articles = self.parse_rss(content)
+                    for article in articles:
+                        article['feed_source'] = source
+                    all_articles.extend(articles)
         
-        # Sort by date (newest first) and limit
-        all_articles.sort(key=lambda x: x.get('published', ''), reverse=True)
-        return all_articles[:limit]
+        # Newest first, keeping only the top `limit` (O(N log limit) vs a full sort)
+        return heapq.nlargest(limit, all_articles, key=lambda x: x.get('published', ''))
     
     def save_to_json(self, articles: List[Dict], filename: str):
         """Save articles to JSON file"""
@@ -128,8 +216,13 @@ class SportsRSSFetcher:
             'count': len(articles),
             'articles': articles
         }
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            # Compact separators skip the slow pure-Python pretty-printer
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
         print(f"Saved {len(articles)} articles to {filename}")
 
 def main():
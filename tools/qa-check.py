@@ -10,22 +10,63 @@ Usage:
     python3 tools/qa-check.py --verbose    # Detailed output
     python3 tools/qa-check.py --fix        # Auto-fix common issues
     python3 tools/qa-check.py --report     # Generate HTML report
-    python3 tools/qa-check.py --fix --report --verbose  # All options
+    python3 tools/qa-check.py --fix --report --verbose  # Common combination
+    python3 tools/qa-check.py --quiet      # Only failures and summary
+    python3 tools/qa-check.py --jobs 8     # Cap concurrent page checks
+    python3 tools/qa-check.py --offline    # No HTTP: site URLs checked against public/
+    python3 tools/qa-check.py --no-cache   # Don't read or write the caches
+    python3 tools/qa-check.py --refresh-cache  # Re-check everything, rewrite caches
 
 Run from workspace root: /home/node/.openclaw/workspace/
+
+Caches (in the working directory, safe to delete):
+    .qa-url-cache.json   URLs that answered 200, trusted for an hour
+    .qa-page-cache.json  parsed pages, reused while a page is unchanged
 """
 
 import argparse
+import codecs
+import hashlib
+import http.client
 import json
 import os
 import re
+import ssl
 import sys
+import tempfile
+import threading
 import time
-import urllib.request
-import urllib.error
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
+from string import Template
 from datetime import datetime, timezone
+from enum import IntEnum
+from urllib.parse import unquote, urljoin, urlsplit, urlunsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ---------------------------------------------------------------------------
+# Check status codes
+# ---------------------------------------------------------------------------
+class Status(IntEnum):
+    """Status of a check and level of each detail line; indexes the tables below."""
+    PASS = 0
+    FAIL = 1
+    WARN = 2
+    FIXED = 3
+    INFO = 4
+
+
+# Lower-cased names, used as CSS classes in the HTML report
+_STATUS_CLASSES = tuple(s.name.lower() for s in Status)
 
 
 # ---------------------------------------------------------------------------
@@ -45,23 +86,59 @@ class C:
 
     @staticmethod
     def ok(msg):
-        return f"{C.GREEN}PASS{C.RESET} {msg}"
+        return _PASS_PREFIX + msg
 
     @staticmethod
     def fail(msg):
-        return f"{C.RED}FAIL{C.RESET} {msg}"
+        return _FAIL_PREFIX + msg
 
     @staticmethod
     def warn(msg):
-        return f"{C.YELLOW}WARN{C.RESET} {msg}"
+        return _WARN_PREFIX + msg
 
     @staticmethod
     def info(msg):
-        return f"{C.CYAN}INFO{C.RESET} {msg}"
+        return _INFO_PREFIX + msg
+
+    @staticmethod
+    def fixed(msg):
+        return _FIXD_PREFIX + msg
 
     @staticmethod
     def header(msg):
-        return f"\n{C.BOLD}{C.WHITE}{'=' * 60}\n  {msg}\n{'=' * 60}{C.RESET}"
+        return _HEADER_OPEN + msg + _HEADER_CLOSE
+
+
+def _use_color():
+    """Color only on a terminal; NO_COLOR disables it, FORCE_COLOR forces it.
+
+    FORCE_COLOR=0 (or empty) counts as unset, as in Node and most CLIs.
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR", "") not in ("", "0"):
+        return True
+    return sys.stdout.isatty()
+
+
+# Piped to a file or CI log: blank every code once, so all colored f-strings
+# below collapse to plain text without per-call checks.
+if not _use_color():
+    for _name in ("RESET", "BOLD", "DIM", "RED", "GREEN", "YELLOW", "BLUE", "CYAN", "WHITE"):
+        setattr(C, _name, "")
+
+# Escape sequences are fixed, so build each prefix once instead of per call
+_PASS_PREFIX = f"{C.GREEN}PASS{C.RESET} "
+_FAIL_PREFIX = f"{C.RED}FAIL{C.RESET} "
+_WARN_PREFIX = f"{C.YELLOW}WARN{C.RESET} "
+_INFO_PREFIX = f"{C.CYAN}INFO{C.RESET} "
+_FIXD_PREFIX = f"{C.BLUE}FIXD{C.RESET} "
+_HEADER_OPEN = f"\n{C.BOLD}{C.WHITE}{'=' * 60}\n  "
+_HEADER_CLOSE = f"\n{'=' * 60}{C.RESET}"
+
+# Used by _print_result for check headlines and detail lines, indexed by Status
+_STATUS_PRINTERS = (C.ok, C.fail, C.warn, C.fixed, C.info)
+_DETAIL_COLORS = (C.GREEN, C.RED, C.YELLOW, C.BLUE, C.DIM)
 
 
 # ---------------------------------------------------------------------------
@@ -74,12 +151,40 @@ PROJECTS_DIR = PUBLIC_DIR / "projects"
 INDEX_JSON = PROJECTS_DIR / "index.json"
 MAIN_INDEX = PUBLIC_DIR / "index.html"
 REPORT_FILE = PUBLIC_DIR / "qa-report.html"
+REPORT_BUFFER = 1 << 20  # write buffer for the streamed HTML report
+URL_CACHE_FILE = Path(".qa-url-cache.json")   # kept out of the served web root
+URL_CACHE_TTL = 3600     # seconds a successful URL check is trusted across runs
+PAGE_CACHE_FILE = Path(".qa-page-cache.json")  # parsed pages, keyed by content
+PAGE_CACHE_VERSION = 1   # bump when the snapshot() layout changes
 HTTP_TIMEOUT = 10
+WEB_ROOT = Path("public")   # directory served at http://clawdbot-web/
+SITE_HOST = urlsplit(BASE_URL).netloc
+MAX_JOBS = 32            # default cap on concurrent page checks
+MAX_RESIDENT_PAGES = 32  # pages read+parsed at once, whatever --jobs is
+PARSE_CHUNK = 64 * 1024  # bytes decoded and fed to the parser at a time (>= 1 KiB:
+                         # the doctype check only looks at the first chunk)
+MAX_REDIRECTS = 10       # same limit urllib applies
+USER_AGENT = "OpenClaw-QA/1.0"
+
+# index.json entry schema: keys every entry must have, in report order
+INDEX_REQUIRED_FIELDS = ("name", "file")
+_INDEX_REQUIRED_KEYS = frozenset(INDEX_REQUIRED_FIELDS)
+
+# Patterns used on every file / directory name. All of them match ASCII
+# syntax only (doctype, JSON whitespace, test-N digits), so re.ASCII keeps
+# \s/\d and case folding off the Unicode tables.
+_DOCTYPE_RE = re.compile(r'<!DOCTYPE\s+html', re.IGNORECASE | re.ASCII)
+_NUM_SPLIT_RE = re.compile(r'(\d+)', re.ASCII)
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])', re.ASCII)
 
 
 # ---------------------------------------------------------------------------
 # HTML structure validator
 # ---------------------------------------------------------------------------
+# Tags HTMLStructureValidator reacts to; everything else is skipped early
+_TAGS_OF_INTEREST = frozenset(("html", "head", "body", "title", "a", "link", "script", "img"))
+
+
 class HTMLStructureValidator(HTMLParser):
     """Parses HTML and tracks structural elements."""
 
@@ -92,50 +197,108 @@ class HTMLStructureValidator(HTMLParser):
         self.has_title = False
         self.links = []          # href values from <a> tags
         self.asset_refs = []     # src/href for CSS, JS, images
+        self.ref_kinds = {}      # ref -> _classify_ref(ref), once per distinct ref
         self.in_title = False
         self.title_text = ""
         self.errors = []
-        self._tag_stack = []
+        self._started = False
 
     def feed(self, data):
-        # Check for doctype before parsing (HTMLParser strips it)
-        if re.search(r'<!DOCTYPE\s+html', data, re.IGNORECASE):
-            self.has_doctype = True
+        # Check for doctype before parsing (HTMLParser strips it). It is
+        # almost always the first token; otherwise only the head of the
+        # document is searched (after a BOM, comment or odd spacing).
+        # Later chunks of an incremental feed are not the document head.
+        if not self._started:
+            self._started = True
+            head = data[:512].lstrip("\ufeff \t\r\n\f")
+            if head[:14].lower() == "<!doctype html" or _DOCTYPE_RE.search(data, 0, 1024):
+                self.has_doctype = True
         super().feed(data)
 
     def handle_starttag(self, tag, attrs):
-        tag_lower = tag.lower()
-        attrs_dict = dict(attrs)
-        self._tag_stack.append(tag_lower)
+        # HTMLParser lower-cases tag names; most tags need no work at all
+        if tag not in _TAGS_OF_INTEREST:
+            return
 
-        if tag_lower == "html":
+        if tag == "html":
             self.has_html = True
-        elif tag_lower == "head":
+        elif tag == "head":
             self.has_head = True
-        elif tag_lower == "body":
+        elif tag == "body":
             self.has_body = True
-        elif tag_lower == "title":
+        elif tag == "title":
             self.has_title = True
             self.in_title = True
 
         # Collect links
-        if tag_lower == "a" and "href" in attrs_dict:
-            href = attrs_dict["href"]
-            if href and not href.startswith(("#", "mailto:", "javascript:", "tel:")):
-                self.links.append(href)
+        elif tag == "a":
+            attrs_dict = dict(attrs)
+            if "href" in attrs_dict:
+                href = attrs_dict["href"]
+                if href and not href.startswith(("#", "mailto:", "javascript:", "tel:")):
+                    self._add_ref(self.links, href, href)
 
         # Collect asset references
-        if tag_lower == "link" and attrs_dict.get("rel", "").lower() == "stylesheet":
-            href = attrs_dict.get("href", "")
-            if href:
-                self.asset_refs.append(("css", href))
-        elif tag_lower == "script" and "src" in attrs_dict:
-            self.asset_refs.append(("js", attrs_dict["src"]))
-        elif tag_lower == "img" and "src" in attrs_dict:
-            self.asset_refs.append(("img", attrs_dict["src"]))
+        elif tag == "link":
+            attrs_dict = dict(attrs)
+            if attrs_dict.get("rel", "").lower() == "stylesheet":
+                href = attrs_dict.get("href", "")
+                if href:
+                    self._add_ref(self.asset_refs, ("css", href), href)
+        else:
+            attrs_dict = dict(attrs)
+            if "src" in attrs_dict:
+                src = attrs_dict["src"]
+                self._add_ref(self.asset_refs, ("js" if tag == "script" else "img", src), src)
+
+    # Parse results worth keeping across runs (see _parse_page)
+    _SNAPSHOT_FLAGS = ("has_doctype", "has_html", "has_head", "has_body", "has_title")
+
+    def snapshot(self):
+        """Return the parse results as JSON-serializable data."""
+        data = {flag: getattr(self, flag) for flag in self._SNAPSHOT_FLAGS}
+        data["title_text"] = self.title_text
+        data["links"] = self.links
+        data["asset_refs"] = self.asset_refs
+        return data
+
+    @classmethod
+    def from_snapshot(cls, data):
+        """Rebuild a validator from snapshot() output without parsing.
+
+        Raises KeyError/TypeError/ValueError if data is not snapshot-shaped.
+        """
+        validator = cls()
+        for flag in cls._SNAPSHOT_FLAGS:
+            setattr(validator, flag, bool(data[flag]))
+        validator.title_text = str(data["title_text"])
+        for href in data["links"]:
+            if not isinstance(href, str):
+                raise TypeError(f"link is not a string: {href!r}")
+            validator._add_ref(validator.links, href, href)
+        for asset_type, ref in data["asset_refs"]:
+            if not (isinstance(asset_type, str) and isinstance(ref, str)):
+                raise TypeError(f"asset ref is not a string pair: {(asset_type, ref)!r}")
+            validator._add_ref(validator.asset_refs, (asset_type, ref), ref)
+        return validator
+
+    def _add_ref(self, target, item, ref):
+        target.append(item)
+        if ref not in self.ref_kinds:
+            self.ref_kinds[ref] = _classify_ref(ref)
+
+    @property
+    def unique_links(self):
+        """Links in document order with repeats dropped."""
+        return list(dict.fromkeys(self.links))
+
+    @property
+    def unique_asset_refs(self):
+        """(type, ref) pairs in document order with repeats dropped."""
+        return list(dict.fromkeys(self.asset_refs))
 
     def handle_endtag(self, tag):
-        if tag.lower() == "title":
+        if tag == "title":
             self.in_title = False
 
     def handle_data(self, data):
@@ -149,52 +312,66 @@ class HTMLStructureValidator(HTMLParser):
 class CheckResult:
     """Stores the result of a single check."""
 
+    __slots__ = ("name", "category", "status", "details", "sub_checks")
+
     def __init__(self, name, category="general"):
         self.name = name
         self.category = category
-        self.status = "PASS"       # PASS, FAIL, WARN, FIXED
+        self.status = Status.PASS  # PASS, FAIL, WARN, FIXED
         self.details = []
         self.sub_checks = []
 
     def fail(self, msg):
-        self.status = "FAIL"
-        self.details.append(("FAIL", msg))
+        self.status = Status.FAIL
+        self.details.append((Status.FAIL, msg))
 
     def warn(self, msg):
-        if self.status == "PASS":
-            self.status = "WARN"
-        self.details.append(("WARN", msg))
+        if self.status is Status.PASS:
+            self.status = Status.WARN
+        self.details.append((Status.WARN, msg))
 
     def ok(self, msg):
-        self.details.append(("PASS", msg))
+        self.details.append((Status.PASS, msg))
 
     def fixed(self, msg):
-        self.status = "FIXED"
-        self.details.append(("FIXED", msg))
+        self.status = Status.FIXED
+        self.details.append((Status.FIXED, msg))
 
     def info(self, msg):
-        self.details.append(("INFO", msg))
+        self.details.append((Status.INFO, msg))
 
     @property
     def passed(self):
-        return self.status in ("PASS", "FIXED", "WARN")
+        return self.status is not Status.FAIL
 
 
 class QAReport:
     """Collects all check results."""
 
+    __slots__ = ("results", "start_time", "end_time", "fixes_applied", "_counts")
+
     def __init__(self):
         self.results = []
         self.start_time = time.time()
         self.end_time = None
         self.fixes_applied = 0
+        self._counts = None
 
     def add(self, result):
         self.results.append(result)
         return result
 
     def finalize(self):
+        # Results may still change status after add(), so count once here
         self.end_time = time.time()
+        self._counts = Counter(r.status for r in self.results)
+
+    @property
+    def counts(self):
+        """Results per status: the frozen tally after finalize(), else live."""
+        if self._counts is not None:
+            return self._counts
+        return Counter(r.status for r in self.results)
 
     @property
     def elapsed(self):
@@ -207,19 +384,19 @@ class QAReport:
 
     @property
     def passed(self):
-        return sum(1 for r in self.results if r.status == "PASS")
+        return self.counts[Status.PASS]
 
     @property
     def failed(self):
-        return sum(1 for r in self.results if r.status == "FAIL")
+        return self.counts[Status.FAIL]
 
     @property
     def warnings(self):
-        return sum(1 for r in self.results if r.status == "WARN")
+        return self.counts[Status.WARN]
 
     @property
     def fixed(self):
-        return sum(1 for r in self.results if r.status == "FIXED")
+        return self.counts[Status.FIXED]
 
     @property
     def all_passed(self):
@@ -229,29 +406,355 @@ class QAReport:
 # ---------------------------------------------------------------------------
 # HTTP helper
 # ---------------------------------------------------------------------------
-def http_get(url, timeout=HTTP_TIMEOUT):
-    """Fetch a URL. Returns (status_code, content_bytes) or (error_code, None)."""
+# Keep-alive connections, one per (scheme, host) per worker thread. Nearly
+# every request goes to the same web server, so reusing sockets avoids a
+# TCP (and TLS) handshake per page, link and asset.
+_local = threading.local()
+_RETRYABLE = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+_ssl_ctx = None
+_ssl_ctx_lock = threading.Lock()
+
+
+def _ssl_context():
+    """One verified TLS context for all HTTPS connections (loads CAs once)."""
+    global _ssl_ctx
+    with _ssl_ctx_lock:
+        if _ssl_ctx is None:
+            _ssl_ctx = ssl.create_default_context()
+        return _ssl_ctx
+
+
+def _get_connection(scheme, netloc, timeout):
+    """Return this thread's pooled connection for (scheme, netloc)."""
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(netloc, timeout=timeout, context=_ssl_context())
+        else:
+            conn = http.client.HTTPConnection(netloc, timeout=timeout)
+        conns[(scheme, netloc)] = conn
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn
+
+
+def _drop_connection(scheme, netloc):
+    """Close and forget this thread's connection for (scheme, netloc)."""
+    conn = getattr(_local, "conns", {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def _http_request(method, url, timeout=HTTP_TIMEOUT, headers=None):
+    """Issue one request on a pooled connection, following redirects.
+
+    Returns (status_code, body_bytes). Raises OSError/HTTPException on
+    transport errors.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise http.client.InvalidURL(url)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        req_headers = {"User-Agent": USER_AGENT}
+        if headers:
+            req_headers.update(headers)
+
+        # A server may close an idle keep-alive socket; retry once on a fresh one
+        for attempt in range(2):
+            conn = _get_connection(parts.scheme, parts.netloc, timeout)
+            reused = conn.sock is not None
+            try:
+                conn.request(method, target, headers=req_headers)
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except _RETRYABLE:
+                _drop_connection(parts.scheme, parts.netloc)
+                if not reused or attempt:
+                    raise
+            except Exception:
+                _drop_connection(parts.scheme, parts.netloc)
+                raise
+        if resp.will_close:
+            _drop_connection(parts.scheme, parts.netloc)
+
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            url = urljoin(url, location)
+            if resp.status == 303 and method != "HEAD":
+                method = "GET"
+            continue
+        return resp.status, body
+    raise http.client.HTTPException(f"Too many redirects: {url}")
+
+
+# Set by --offline: site URLs are answered from WEB_ROOT, nothing else is fetched
+_offline = False
+
+
+def _offline_status(url):
+    """Status for a site URL resolved against WEB_ROOT, or None if not ours."""
+    parts = urlsplit(url)
+    if parts.netloc.lower() != SITE_HOST.lower():
+        return None
+    target = WEB_ROOT / unquote(parts.path).lstrip("/")
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "OpenClaw-QA/1.0"})
-        resp = urllib.request.urlopen(req, timeout=timeout)
-        return resp.getcode(), resp.read()
-    except urllib.error.HTTPError as e:
-        return e.code, None
-    except urllib.error.URLError as e:
-        return -1, None
+        if target.is_dir():
+            target = target / "index.html"
+        return 200 if target.is_file() else 404
+    except (OSError, ValueError):   # e.g. name too long, embedded NUL
+        return 404
+
+
+def _http_head(url, timeout=HTTP_TIMEOUT):
+    """Return the status for url without downloading its body, or -1.
+
+    Uses HEAD, falling back to a one-byte ranged GET for servers that do
+    not implement HEAD (a 206 answer is reported as 200).
+    """
+    try:
+        code, _ = _http_request("HEAD", url, timeout)
+        if code in (405, 501):
+            code, _ = _http_request("GET", url, timeout, {"Range": "bytes=0-0"})
+            if code == 206:
+                code = 200
     except Exception:
-        return -1, None
+        return -1
+    return code
+
+
+# Run-wide memo of URL status codes: the main index, shared nav/footer links
+# and CDN assets are otherwise probed once per check that mentions them.
+# Entries are Futures so concurrent workers asking for the same URL wait on
+# a single request.
+_url_cache = {}
+_url_cache_lock = threading.Lock()
+
+# Cross-run memo: {url: unix time of the last successful check}. Only
+# successes are persisted so a fixed link is picked up on the next run.
+_disk_cache = {}
+
+
+def _json_loads(data):
+    """Parse JSON bytes, with orjson when it is installed.
+
+    Input orjson rejects (BOM, UTF-16, huge ints, invalid JSON) goes through
+    the json module, so results and error messages match the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_url_cache(path=URL_CACHE_FILE):
+    """Load still-fresh successful URL checks from a previous run."""
+    try:
+        data = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return
+    if not isinstance(data, dict):
+        return
+    now = time.time()
+    _disk_cache.update({url: ts for url, ts in data.items()
+                        if isinstance(ts, (int, float)) and now - ts < URL_CACHE_TTL})
+
+
+def save_url_cache(path=URL_CACHE_FILE):
+    """Atomically write the fresh successful URL checks; best-effort."""
+    now = time.time()
+    with _url_cache_lock:
+        data = {url: ts for url, ts in _disk_cache.items() if now - ts < URL_CACHE_TTL}
+    _write_json_atomic(path, data)
+
+
+def _write_json_atomic(path, data):
+    """Write data as JSON via a temp file + rename; errors are ignored."""
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+@lru_cache(maxsize=None)
+def _url_key(url):
+    """Memo key for url: lower-case host, no fragment, sorted query.
+
+    Only used to look results up; probes always go to the URL as written.
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url.split("#", 1)[0]   # malformed; the probe will report -1
+    userinfo, at, hostport = parts.netloc.rpartition("@")
+    query = parts.query
+    if "&" in query:
+        query = "&".join(sorted(query.split("&")))
+    return urlunsplit((parts.scheme, userinfo + at + hostport.lower(),
+                       parts.path or "/", query, ""))
+
+
+def url_status(url, timeout=HTTP_TIMEOUT):
+    """Return the live HTTP status for url, or -1 (memoized per run).
+
+    In --offline mode site URLs resolve against WEB_ROOT (200 or 404) and
+    other URLs report -1.
+    """
+    key = _url_key(url)    # equivalent spellings share one probe
+    with _url_cache_lock:
+        future = _url_cache.get(key)
+        owner = future is None
+        if owner:
+            future = _url_cache[key] = Future()
+    if owner:
+        # Always resolve the Future, or threads waiting on it hang
+        try:
+            if _offline:
+                code = _offline_status(url)
+                code = -1 if code is None else code
+            else:
+                code = _http_head(url, timeout)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        future.set_result(code)
+    return future.result()
 
 
 def url_accessible(url, timeout=HTTP_TIMEOUT):
-    """Return True if URL returns HTTP 200."""
-    code, _ = http_get(url, timeout)
-    return code == 200
+    """Return True if URL returns HTTP 200 (memoized per run and on disk)."""
+    key = _url_key(url)
+    if not _offline and key in _disk_cache:
+        return True
+    ok = url_status(url, timeout) == 200
+    if ok and not _offline:
+        with _url_cache_lock:
+            _disk_cache[key] = time.time()
+    return ok
+
+
+# Separate pool for per-URL probes: page workers block on it, so sharing the
+# page pool could deadlock once every page worker is waiting.
+_url_executor = ThreadPoolExecutor(max_workers=MAX_JOBS, thread_name_prefix="qa-url")
+
+
+def _check_urls(urls):
+    """Run url_accessible over urls concurrently; returns {url: bool}."""
+    unique = list(dict.fromkeys(urls))
+    return dict(zip(unique, _url_executor.map(url_accessible, unique)))
+
+
+@lru_cache(maxsize=None)
+def _dir_entries(dir_str):
+    """One scandir per directory: {name: DirEntry} (empty if not a directory)."""
+    try:
+        with os.scandir(dir_str or ".") as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
+
+
+def _lookup(path_str):
+    """Return the DirEntry for a normalized relative path, or None.
+
+    A symlink only counts if its target exists; a dangling one is missing.
+    """
+    parent, name = os.path.split(path_str)
+    if name in ("", ".", ".."):
+        return None
+    entry = _dir_entries(parent).get(name)
+    if entry is not None and entry.is_symlink():
+        try:
+            entry.stat()    # follows the link; cached on the DirEntry
+        except OSError:
+            return None
+    return entry
+
+
+_site_paths_set = None
+_site_paths_lock = threading.Lock()
+
+
+def _site_paths():
+    """Every real file and directory under WEB_ROOT, from a single walk.
+
+    Symlinks are left out (a dangling one must not count as existing);
+    they are answered by _lookup, which checks the link target.
+    """
+    global _site_paths_set
+    with _site_paths_lock:
+        if _site_paths_set is None:
+            root = str(WEB_ROOT)
+            paths = {root}
+            pending = [root]
+            while pending:
+                try:
+                    with os.scandir(pending.pop()) as it:
+                        for e in it:
+                            if e.is_symlink():
+                                continue
+                            paths.add(e.path)
+                            if e.is_dir(follow_symlinks=False):
+                                pending.append(e.path)
+                except OSError:
+                    continue
+            _site_paths_set = frozenset(paths)
+        return _site_paths_set
+
+
+def _path_exists(path_str):
+    """Local existence check for link/asset targets.
+
+    Answered from the _site_paths() set; a miss is confirmed against the
+    directory listings, which also covers symlinks (not in the set) and
+    files created by --fix after the walk.
+    """
+    if path_str in _site_paths():
+        return True
+    if os.path.basename(path_str) in ("", ".", ".."):
+        return os.path.exists(path_str)
+    return _lookup(path_str) is not None
 
 
 # ---------------------------------------------------------------------------
 # Check functions
 # ---------------------------------------------------------------------------
+@dataclass
+class WorkspaceIndex:
+    """Test-N directories under PROJECTS_DIR, scanned once per run."""
+    test_dirs: list[Path]       # natural-sorted
+    test_dir_names: set[str]
+    exists: bool = True         # False if PROJECTS_DIR itself is missing
+
+    @classmethod
+    def scan(cls, projects_dir=PROJECTS_DIR):
+        # DirEntry.is_dir() answers from readdir's d_type, no stat per entry
+        try:
+            with os.scandir(projects_dir) as it:
+                entries = sorted((e for e in it if e.is_dir()),
+                                 key=lambda e: _natural_sort_key(e.name))
+        except (FileNotFoundError, NotADirectoryError):
+            return cls([], set(), exists=False)
+        return cls([Path(e.path) for e in entries], {e.name for e in entries})
+
+
 def check_main_index(report, verbose=False):
     """Check 6: Main index.html at /clawdbot/."""
     result = report.add(CheckResult("Main index.html", "structure"))
@@ -261,24 +764,21 @@ def check_main_index(report, verbose=False):
         result.fail(f"File not found: {MAIN_INDEX}")
         return result
 
-    content = MAIN_INDEX.read_text(encoding="utf-8", errors="replace")
-    if len(content.strip()) == 0:
+    size, validator, error = _parse_page(MAIN_INDEX)
+    if validator is None:
         result.fail("Main index.html is empty")
         return result
 
-    result.ok(f"File exists ({len(content)} bytes)")
+    result.ok(f"File exists ({size} bytes)")
 
     # HTML structure
-    validator = HTMLStructureValidator()
-    try:
-        validator.feed(content)
-    except Exception as e:
-        result.warn(f"HTML parse error: {e}")
+    if error is not None:
+        result.warn(f"HTML parse error: {error}")
 
     _check_html_structure(result, validator, verbose)
 
-    # HTTP check
-    code, _ = http_get(BASE_URL)
+    # HTTP check (shared with any page linking to the index)
+    code = url_status(BASE_URL)
     if code == 200:
         result.ok(f"HTTP 200 from {BASE_URL}")
     else:
@@ -287,27 +787,28 @@ def check_main_index(report, verbose=False):
     return result
 
 
-def check_index_json(report, verbose=False, fix=False):
+def check_index_json(report, verbose=False, fix=False, workspace=None):
     """Check 2: Validate index.json structure and references."""
     result = report.add(CheckResult("index.json validation", "data"))
+    if workspace is None:
+        workspace = WorkspaceIndex.scan()
 
     if not INDEX_JSON.exists():
         result.fail(f"File not found: {INDEX_JSON}")
         if fix:
-            _fix_create_index_json(result, report)
-        return result
-
-    raw = INDEX_JSON.read_text(encoding="utf-8", errors="replace")
-    if len(raw.strip()) == 0:
-        result.fail("index.json is empty")
-        if fix:
-            _fix_create_index_json(result, report)
+            _fix_create_index_json(result, report, workspace)
         return result
 
-    # Parse JSON
+    # Parse JSON straight from the file; the text is only needed on failure
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as e:
+        data = _json_loads(INDEX_JSON.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raw = INDEX_JSON.read_text(encoding="utf-8", errors="replace")
+        if len(raw.strip()) == 0:
+            result.fail("index.json is empty")
+            if fix:
+                _fix_create_index_json(result, report, workspace)
+            return result
         result.fail(f"Invalid JSON: {e}")
         if fix:
             _fix_broken_json(result, raw)
@@ -320,106 +821,253 @@ def check_index_json(report, verbose=False, fix=False):
     result.ok(f"Valid JSON array with {len(data)} entries")
 
     # Validate each entry
-    required_fields = ["name", "file"]
     for i, entry in enumerate(data):
         if not isinstance(entry, dict):
             result.fail(f"Entry {i} is not an object")
             continue
 
-        for field in required_fields:
-            if field not in entry:
-                result.warn(f"Entry {i} ({entry.get('name', '?')}): missing '{field}'")
+        # One subset test for the common case; name the missing keys otherwise
+        if not _INDEX_REQUIRED_KEYS <= entry.keys():
+            for field in INDEX_REQUIRED_FIELDS:
+                if field not in entry:
+                    result.warn(f"Entry {i} ({entry.get('name', '?')}): missing '{field}'")
 
         # Check referenced file exists
         file_ref = entry.get("file", "")
         if file_ref:
-            file_path = PROJECTS_DIR / file_ref
-            if not file_path.exists():
+            found = _lookup(os.path.normpath(PROJECTS_DIR / file_ref))
+            try:
+                size = None if found is None else found.stat().st_size
+            except OSError:
+                size = None
+            if size is None:
                 result.fail(f"Entry '{entry.get('name', '?')}': file not found: {file_ref}")
-            elif file_path.stat().st_size == 0:
+            elif size == 0:
                 result.fail(f"Entry '{entry.get('name', '?')}': file is empty: {file_ref}")
             elif verbose:
                 result.ok(f"Entry '{entry.get('name', '?')}': {file_ref} OK")
 
     # Check for directories not in index.json
-    if PROJECTS_DIR.exists():
+    if workspace.exists:
         indexed_dirs = set()
         for entry in data:
             f = entry.get("file", "")
             if "/" in f:
                 indexed_dirs.add(f.split("/")[0])
 
-        for d in sorted(PROJECTS_DIR.iterdir()):
-            if d.is_dir() and d.name not in indexed_dirs:
-                result.warn(f"Directory '{d.name}' exists but has no index.json entry")
-                if fix:
-                    _fix_add_index_entry(result, data, d.name, report)
+        for name in sorted(workspace.test_dir_names - indexed_dirs):
+            result.warn(f"Directory '{name}' exists but has no index.json entry")
+            if fix:
+                _fix_add_index_entry(result, data, name, report)
 
     return result
 
 
-def check_project_pages(report, verbose=False, fix=False):
-    """Check 1, 3, 4: Validate all project pages."""
+def check_project_pages(report, verbose=False, fix=False, jobs=None, workspace=None,
+                        pending=None):
+    """Check 1, 3, 4: Validate all project pages.
+
+    pending is an optional Future from start_page_checks() that is already
+    running the page checks; its results are merged instead of re-running.
+    """
     results = []
+    if workspace is None:
+        workspace = WorkspaceIndex.scan()
 
-    if not PROJECTS_DIR.exists():
+    if not workspace.exists:
         r = report.add(CheckResult("Projects directory", "structure"))
         r.fail(f"Directory not found: {PROJECTS_DIR}")
         return results
 
-    # Iterate over test-N directories in sorted order
-    test_dirs = sorted(
-        [d for d in PROJECTS_DIR.iterdir() if d.is_dir()],
-        key=lambda p: _natural_sort_key(p.name)
-    )
+    # Workers never touch `report`; results are merged here in sorted order
+    if pending is not None:
+        page_results = pending.result()
+    else:
+        page_results = _run_page_checks(workspace.test_dirs, verbose, fix, jobs)
 
-    for test_dir in test_dirs:
-        result = report.add(CheckResult(f"Page: {test_dir.name}", "page"))
+    for result in page_results:
+        report.add(result)
+        if result.status is Status.FIXED:
+            report.fixes_applied += 1
         results.append(result)
 
-        index_file = test_dir / "index.html"
+    return results
 
-        # Check 3: file exists and non-empty
-        if not index_file.exists():
-            result.fail("index.html does not exist")
-            if fix:
-                _fix_create_placeholder(result, index_file, test_dir.name, report)
-            continue
 
-        content = index_file.read_text(encoding="utf-8", errors="replace")
-        if len(content.strip()) == 0:
-            result.fail("index.html is empty (0 bytes)")
-            if fix:
-                _fix_create_placeholder(result, index_file, test_dir.name, report)
-            continue
+def _run_page_checks(test_dirs, verbose, fix, jobs):
+    """Check test_dirs on a bounded pool; returns results in test_dirs order."""
+    if not test_dirs:
+        return []
+    # Pages are independent and I/O bound: check them on a bounded pool
+    max_workers = jobs or min(MAX_JOBS, len(test_dirs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda d: _check_one_page(d, verbose, fix), test_dirs))
+
+
+def start_page_checks(verbose, fix, jobs, workspace):
+    """Start the page checks in the background; returns a Future of results.
+
+    Pass the Future to check_project_pages() to merge them. Only safe while
+    nothing else writes under PROJECTS_DIR, i.e. without --fix.
+    """
+    starter = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qa-pages")
+    future = starter.submit(_run_page_checks, workspace.test_dirs, verbose, fix, jobs)
+    starter.shutdown(wait=False)
+    return future
+
+
+def _check_one_page(test_dir, verbose=False, fix=False):
+    """Run all checks for a single test-N directory and return its result."""
+    result = CheckResult(f"Page: {test_dir.name}", "page")
+    index_file = test_dir / "index.html"
+
+    # Check 3: file exists and non-empty
+    # (from the page directory's listing; the read can still find it gone,
+    # e.g. a symlink whose target disappeared)
+    parsed = None
+    if _lookup(str(index_file)) is not None:
+        try:
+            parsed = _parse_page(index_file)
+        except OSError:
+            pass
+    if parsed is None:
+        result.fail("index.html does not exist")
+        if fix:
+            _fix_create_placeholder(result, index_file, test_dir.name)
+        return result
 
-        result.ok(f"File exists ({len(content)} bytes)")
+    size, validator, error = parsed
+    if validator is None:
+        result.fail("index.html is empty (0 bytes)")
+        if fix:
+            _fix_create_placeholder(result, index_file, test_dir.name)
+        return result
+
+    result.ok(f"File exists ({size} bytes)")
+
+    # Check 4: HTML structure
+    if error is not None:
+        result.warn(f"HTML parse error: {error}")
+        return result
+
+    _check_html_structure(result, validator, verbose)
+
+    # Check 1: HTTP 200 via internal URL
+    page_url = f"{PROJECTS_URL}{test_dir.name}/index.html"
+    code = url_status(page_url)
+    if code == 200:
+        result.ok(f"HTTP 200 OK")
+    else:
+        result.fail(f"HTTP {code} from {page_url}")
+
+    # Check 5: internal links
+    _check_internal_links(result, validator, test_dir, verbose)
+
+    # Check 7: asset references
+    _check_assets(result, validator, test_dir, verbose)
+
+    return result
+
+
+# Bounds how many page bodies are in memory at once; the network checks that
+# follow only need the parsed validator, so they run outside the slot.
+_parse_slots = threading.BoundedSemaphore(MAX_RESIDENT_PAGES)
+
+
+# Cross-run memo of parsed pages: {path: {mtime_ns, size, hash, parse}}.
+# Only the parse is reused; links, assets and HTTP status are always
+# re-checked, since their targets can change while the page does not.
+_page_cache = {}        # loaded from the previous run
+_page_cache_out = {}    # entries for pages seen in this run
+_page_cache_lock = threading.Lock()
+
+
+def load_page_cache(path=PAGE_CACHE_FILE):
+    """Load parsed-page entries from a previous run.
+
+    A file written by a different PAGE_CACHE_VERSION is ignored as a whole.
+    """
+    try:
+        data = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return
+    if not isinstance(data, dict) or data.get("version") != PAGE_CACHE_VERSION:
+        return
+    pages = data.get("pages")
+    if isinstance(pages, dict):
+        _page_cache.update(pages)
+
+
+def save_page_cache(path=PAGE_CACHE_FILE):
+    """Atomically write the entries for this run's pages; best-effort."""
+    with _page_cache_lock:
+        pages = dict(_page_cache_out)
+    _write_json_atomic(path, {"version": PAGE_CACHE_VERSION, "pages": pages})
+
+
+def _parse_page(path):
+    """Read and parse a page; returns (size, validator, error).
+
+    validator is None for a blank file; error is the parser exception, if any.
+    A page whose (mtime, size) or content hash matches the page cache is not
+    parsed again. The raw bytes and decoded text are released before returning.
+    """
+    key = str(path)
+    entry = _page_cache.get(key)
+    if not isinstance(entry, dict):
+        entry = None
+    with _parse_slots:
+        st = path.stat()
+        if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            validator = _restore_page(key, entry, entry)
+            if validator is not None:
+                return st.st_size, validator, None
+
+        raw = path.read_bytes()
+        if not raw.strip():
+            return len(raw), None, None
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        stamp = {"mtime_ns": st.st_mtime_ns, "size": len(raw), "hash": digest}
+        if entry and entry.get("hash") == digest:
+            # Touched but unchanged: keep the parse, refresh the stat fields
+            validator = _restore_page(key, entry, stamp)
+            if validator is not None:
+                return len(raw), validator, None
 
-        # Check 4: HTML structure
         validator = HTMLStructureValidator()
         try:
-            validator.feed(content)
+            _feed_bytes(validator, raw)
         except Exception as e:
-            result.warn(f"HTML parse error: {e}")
-            continue
+            return len(raw), validator, e
+        with _page_cache_lock:
+            _page_cache_out[key] = dict(stamp, parse=validator.snapshot())
+        return len(raw), validator, None
 
-        _check_html_structure(result, validator, verbose)
 
-        # Check 1: HTTP 200 via internal URL
-        page_url = f"{PROJECTS_URL}{test_dir.name}/index.html"
-        code, _ = http_get(page_url)
-        if code == 200:
-            result.ok(f"HTTP 200 OK")
-        else:
-            result.fail(f"HTTP {code} from {page_url}")
+def _feed_bytes(parser, raw):
+    """Decode raw as UTF-8 and feed it to parser in PARSE_CHUNK pieces.
 
-        # Check 5: internal links
-        _check_internal_links(result, validator, test_dir, verbose)
+    Avoids holding a decoded copy of the whole page next to its bytes.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    view = memoryview(raw)
+    for start in range(0, len(raw), PARSE_CHUNK):
+        parser.feed(decoder.decode(view[start:start + PARSE_CHUNK]))
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        parser.feed(tail)
 
-        # Check 7: asset references
-        _check_assets(result, validator, test_dir, verbose)
 
-    return results
+def _restore_page(key, entry, stamp):
+    """Rebuild a validator from a cache entry, or None if it is unusable."""
+    try:
+        validator = HTMLStructureValidator.from_snapshot(entry["parse"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    with _page_cache_lock:
+        _page_cache_out[key] = {"mtime_ns": stamp["mtime_ns"], "size": stamp["size"],
+                                "hash": entry.get("hash"), "parse": entry["parse"]}
+    return validator
 
 
 def _check_html_structure(result, validator, verbose):
@@ -438,23 +1086,70 @@ def _check_html_structure(result, validator, verbose):
             result.warn(f"Missing {label}")
 
 
+def _classify_ref(ref):
+    """Return (kind, normalized) for a link/asset reference.
+
+    kind is one of "skip", "external", "absolute_local" or "relative_local";
+    protocol-relative URLs are normalized to http:.
+    """
+    if ref.startswith(("data:", "blob:")):
+        return "skip", ref
+    if ref.startswith(("http://", "https://")):
+        return "external", ref
+    if ref.startswith("//"):
+        return "external", "http:" + ref
+    if ref.startswith("/"):
+        return "absolute_local", ref
+    return "relative_local", ref
+
+
+def _resolve_local(page_dir, kind, ref):
+    """Resolve a local ref to a normalized relative path string."""
+    if kind == "absolute_local":
+        # Absolute path from site root (web root = public/)
+        target = os.path.join(WEB_ROOT, ref.lstrip("/"))
+    else:
+        target = os.path.join(page_dir, ref)
+    # Strip fragment/query; normpath (not resolve) keeps the path relative
+    return os.path.normpath(target.partition("#")[0].partition("?")[0])
+
+
+def _is_own_site(url):
+    return "clawdbot-web" in url or "pulpouplatform.com" in url
+
+
 def _check_internal_links(result, validator, page_dir, verbose):
     """Check 5: Verify internal links within each page."""
-    if not validator.links:
+    links = validator.unique_links
+    if not links:
         if verbose:
             result.info("No internal links found")
         return
 
+    kinds = validator.ref_kinds
+    # Probe all HTTP links of the page at once; the loop below only reads results
+    reachable = _check_urls([
+        url for kind, url in map(kinds.__getitem__, links)
+        if kind == "external" and _is_own_site(url)
+        and not (_offline and _offline_status(url) is None)
+    ])
+
     checked = 0
     broken = 0
-    for href in validator.links:
-        # Skip external links
-        if href.startswith(("http://", "https://", "//")):
+    for href in links:
+        kind, url = kinds[href]
+        if kind == "skip":
+            continue
+        if kind == "external":
             # Only check links to our own domain
-            if "clawdbot-web" not in href and "pulpouplatform.com" not in href:
+            if not _is_own_site(url):
+                continue
+            # Offline runs can only verify links that map onto WEB_ROOT
+            if url not in reachable:
+                result.warn(f"Link not checked (offline): {href}")
                 continue
             # Check external-but-ours links via HTTP
-            if url_accessible(href):
+            if reachable[url]:
                 if verbose:
                     result.ok(f"Link OK: {href}")
             else:
@@ -463,19 +1158,8 @@ def _check_internal_links(result, validator, page_dir, verbose):
             checked += 1
             continue
 
-        # Relative link - resolve against page directory
-        if href.startswith("/"):
-            # Absolute path from site root (web root = public/)
-            target = Path("public") / href.lstrip("/")
-        else:
-            target = page_dir / href
-
-        # Strip query/fragment
-        target_str = str(target).split("?")[0].split("#")[0]
-        # Normalize .. traversals (use os.path.normpath, not resolve, to stay relative)
-        target = Path(os.path.normpath(target_str))
-
-        if target.exists() or (target.is_dir() and (target / "index.html").exists()):
+        target = _resolve_local(page_dir, kind, href)
+        if _path_exists(target):
             if verbose:
                 result.ok(f"Link OK: {href}")
         else:
@@ -489,22 +1173,34 @@ def _check_internal_links(result, validator, page_dir, verbose):
 
 def _check_assets(result, validator, page_dir, verbose):
     """Check 7: Verify referenced assets (CSS, JS, images) are accessible."""
-    if not validator.asset_refs:
+    asset_refs = validator.unique_asset_refs
+    if not asset_refs:
         if verbose:
             result.info("No asset references found")
         return
 
+    kinds = validator.ref_kinds
+    # Probe all external assets of the page at once
+    reachable = _check_urls([
+        url for kind, url in (kinds[ref] for _, ref in asset_refs)
+        if kind == "external" and not (_offline and _offline_status(url) is None)
+    ])
+
     checked = 0
     broken = 0
-    for asset_type, ref in validator.asset_refs:
+    for asset_type, ref in asset_refs:
+        kind, url = kinds[ref]
         # Skip data URIs and external CDNs
-        if ref.startswith(("data:", "blob:")):
+        if kind == "skip":
             continue
 
-        if ref.startswith(("http://", "https://", "//")):
+        if kind == "external":
             # External asset - check via HTTP
-            url = ref if not ref.startswith("//") else "http:" + ref
-            if url_accessible(url):
+            if url not in reachable:
+                if verbose:
+                    result.info(f"Asset not checked (offline, {asset_type}): {ref}")
+                continue
+            if reachable[url]:
                 if verbose:
                     result.ok(f"Asset OK ({asset_type}): {ref}")
             else:
@@ -514,15 +1210,7 @@ def _check_assets(result, validator, page_dir, verbose):
             checked += 1
         else:
             # Local asset - check file existence
-            if ref.startswith("/"):
-                target = Path("public") / ref.lstrip("/")
-            else:
-                target = page_dir / ref
-
-            target_str = str(target).split("?")[0].split("#")[0]
-            target = Path(os.path.normpath(target_str))
-
-            if target.exists():
+            if _path_exists(_resolve_local(page_dir, kind, ref)):
                 if verbose:
                     result.ok(f"Asset OK ({asset_type}): {ref}")
             else:
@@ -537,21 +1225,19 @@ def _check_assets(result, validator, page_dir, verbose):
 # ---------------------------------------------------------------------------
 # Auto-fix functions
 # ---------------------------------------------------------------------------
-def _fix_create_index_json(result, report):
+def _fix_create_index_json(result, report, workspace):
     """Auto-fix: Create index.json from existing directories."""
     entries = []
-    if PROJECTS_DIR.exists():
-        for d in sorted(PROJECTS_DIR.iterdir(), key=lambda p: _natural_sort_key(p.name)):
-            if d.is_dir():
-                num = d.name.replace("test-", "")
-                entries.append({
-                    "name": f"Test {num}: TBD",
-                    "description": "Test pendiente de documentacion",
-                    "icon": "fa-question",
-                    "status": "PENDING",
-                    "file": f"{d.name}/index.html",
-                    "tags": ["pending"]
-                })
+    for d in workspace.test_dirs:
+        num = d.name.replace("test-", "")
+        entries.append({
+            "name": f"Test {num}: TBD",
+            "description": "Test pendiente de documentacion",
+            "icon": "fa-question",
+            "status": "PENDING",
+            "file": f"{d.name}/index.html",
+            "tags": ["pending"]
+        })
 
     INDEX_JSON.parent.mkdir(parents=True, exist_ok=True)
     INDEX_JSON.write_text(json.dumps(entries, indent=2, ensure_ascii=False) + "\n",
@@ -584,7 +1270,7 @@ def _fix_broken_json(result, raw):
     fixed = raw.strip()
 
     # Remove trailing commas before ] or }
-    fixed = re.sub(r',\s*([}\]])', r'\1', fixed)
+    fixed = _TRAILING_COMMA_RE.sub(r'\1', fixed)
 
     # Ensure array wrapper
     if not fixed.startswith("["):
@@ -601,8 +1287,12 @@ def _fix_broken_json(result, raw):
         result.fail("Could not auto-repair JSON")
 
 
-def _fix_create_placeholder(result, file_path, dir_name, report):
-    """Auto-fix: Create a placeholder index.html for an empty test."""
+def _fix_create_placeholder(result, file_path, dir_name):
+    """Auto-fix: Create a placeholder index.html for an empty test.
+
+    Runs inside page workers, so the fix is counted by the caller when it
+    merges the (FIXED) result into the report.
+    """
     num = dir_name.replace("test-", "")
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -624,51 +1314,33 @@ def _fix_create_placeholder(result, file_path, dir_name, report):
 """
     file_path.parent.mkdir(parents=True, exist_ok=True)
     file_path.write_text(html, encoding="utf-8")
+    _dir_entries.cache_clear()
     result.fixed(f"Created placeholder {file_path}")
-    report.fixes_applied += 1
 
 
 # ---------------------------------------------------------------------------
 # HTML report generator
 # ---------------------------------------------------------------------------
-def generate_html_report(report):
-    """Check 9: Generate a styled HTML report page."""
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    elapsed = f"{report.elapsed:.1f}s"
-
-    # Status badge
-    if report.all_passed:
-        overall_badge = '<span class="badge pass">ALL PASSED</span>'
-    else:
-        overall_badge = f'<span class="badge fail">{report.failed} FAILED</span>'
-
-    rows = []
-    for r in report.results:
-        status_class = r.status.lower()
-        details_html = ""
-        for level, msg in r.details:
-            icon = {"PASS": "checkmark", "FAIL": "cross", "WARN": "warning",
-                    "FIXED": "wrench", "INFO": "info"}.get(level, "info")
-            icon_char = {"checkmark": "&#10004;", "cross": "&#10008;", "warning": "&#9888;",
-                         "wrench": "&#128295;", "info": "&#8505;"}.get(icon, "")
-            details_html += f'<div class="detail {level.lower()}">{icon_char} {_html_escape(msg)}</div>\n'
-
-        rows.append(f"""
-        <tr class="result-row {status_class}">
-            <td class="status-cell"><span class="badge {status_class}">{r.status}</span></td>
-            <td class="name-cell">{_html_escape(r.name)}</td>
-            <td class="category-cell">{_html_escape(r.category)}</td>
-            <td class="details-cell">{details_html}</td>
-        </tr>""")
-
-    html = f"""<!DOCTYPE html>
+# HTML entity shown next to each message, indexed by detail level (Status)
+_DETAIL_ICONS = (
+    "&#10004;",     # PASS: checkmark
+    "&#10008;",     # FAIL: cross
+    "&#9888;",      # WARN: warning
+    "&#128295;",    # FIXED: wrench
+    "&#8505;",      # INFO: info
+)
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Report markup: static parts are plain strings, the rest are Templates
+# compiled once at import; only the $-fields vary between runs.
+_REPORT_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>QA Report - OpenClaw</title>
     <style>
-        :root {{
+        :root {
             --bg: #0d1117;
             --surface: #161b22;
             --border: #30363d;
@@ -680,54 +1352,54 @@ def generate_html_report(report):
             --fixed: #58a6ff;
             --info: #8b949e;
             --accent: #ff6b35;
-        }}
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{
+        }
+        * { box-sizing: border-box; margin: 0; padding: 0; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif;
             background: var(--bg);
             color: var(--text);
             line-height: 1.6;
             padding: 2rem;
-        }}
-        .container {{ max-width: 1100px; margin: 0 auto; }}
-        h1 {{
+        }
+        .container { max-width: 1100px; margin: 0 auto; }
+        h1 {
             font-size: 1.8rem;
             margin-bottom: 0.5rem;
             color: var(--accent);
-        }}
-        .subtitle {{ color: var(--text-dim); margin-bottom: 2rem; }}
-        .summary {{
+        }
+        .subtitle { color: var(--text-dim); margin-bottom: 2rem; }
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
             gap: 1rem;
             margin-bottom: 2rem;
-        }}
-        .summary-card {{
+        }
+        .summary-card {
             background: var(--surface);
             border: 1px solid var(--border);
             border-radius: 8px;
             padding: 1rem;
             text-align: center;
-        }}
-        .summary-card .number {{
+        }
+        .summary-card .number {
             font-size: 2rem;
             font-weight: 700;
-        }}
-        .summary-card .label {{ color: var(--text-dim); font-size: 0.85rem; }}
-        .summary-card.pass .number {{ color: var(--pass); }}
-        .summary-card.fail .number {{ color: var(--fail); }}
-        .summary-card.warn .number {{ color: var(--warn); }}
-        .summary-card.fixed .number {{ color: var(--fixed); }}
-        .summary-card.total .number {{ color: var(--text); }}
-        table {{
+        }
+        .summary-card .label { color: var(--text-dim); font-size: 0.85rem; }
+        .summary-card.pass .number { color: var(--pass); }
+        .summary-card.fail .number { color: var(--fail); }
+        .summary-card.warn .number { color: var(--warn); }
+        .summary-card.fixed .number { color: var(--fixed); }
+        .summary-card.total .number { color: var(--text); }
+        table {
             width: 100%;
             border-collapse: collapse;
             background: var(--surface);
             border: 1px solid var(--border);
             border-radius: 8px;
             overflow: hidden;
-        }}
-        th {{
+        }
+        th {
             background: #1c2128;
             padding: 0.75rem 1rem;
             text-align: left;
@@ -736,13 +1408,13 @@ def generate_html_report(report):
             color: var(--text-dim);
             text-transform: uppercase;
             letter-spacing: 0.05em;
-        }}
-        td {{
+        }
+        td {
             padding: 0.6rem 1rem;
             border-top: 1px solid var(--border);
             vertical-align: top;
-        }}
-        .badge {{
+        }
+        .badge {
             display: inline-block;
             padding: 0.15rem 0.6rem;
             border-radius: 12px;
@@ -750,30 +1422,30 @@ def generate_html_report(report):
             font-weight: 700;
             text-transform: uppercase;
             letter-spacing: 0.05em;
-        }}
-        .badge.pass {{ background: rgba(46,160,67,0.2); color: var(--pass); }}
-        .badge.fail {{ background: rgba(248,81,73,0.2); color: var(--fail); }}
-        .badge.warn {{ background: rgba(210,153,34,0.2); color: var(--warn); }}
-        .badge.fixed {{ background: rgba(88,166,255,0.2); color: var(--fixed); }}
-        .detail {{ font-size: 0.85rem; padding: 0.15rem 0; }}
-        .detail.pass {{ color: var(--pass); }}
-        .detail.fail {{ color: var(--fail); }}
-        .detail.warn {{ color: var(--warn); }}
-        .detail.fixed {{ color: var(--fixed); }}
-        .detail.info {{ color: var(--info); }}
-        .result-row.fail {{ background: rgba(248,81,73,0.04); }}
-        .footer {{
+        }
+        .badge.pass { background: rgba(46,160,67,0.2); color: var(--pass); }
+        .badge.fail { background: rgba(248,81,73,0.2); color: var(--fail); }
+        .badge.warn { background: rgba(210,153,34,0.2); color: var(--warn); }
+        .badge.fixed { background: rgba(88,166,255,0.2); color: var(--fixed); }
+        .detail { font-size: 0.85rem; padding: 0.15rem 0; }
+        .detail.pass { color: var(--pass); }
+        .detail.fail { color: var(--fail); }
+        .detail.warn { color: var(--warn); }
+        .detail.fixed { color: var(--fixed); }
+        .detail.info { color: var(--info); }
+        .result-row.fail { background: rgba(248,81,73,0.04); }
+        .footer {
             margin-top: 2rem;
             text-align: center;
             color: var(--text-dim);
             font-size: 0.8rem;
-        }}
-        .filter-bar {{
+        }
+        .filter-bar {
             margin-bottom: 1rem;
             display: flex;
             gap: 0.5rem;
-        }}
-        .filter-btn {{
+        }
+        .filter-btn {
             background: var(--surface);
             border: 1px solid var(--border);
             color: var(--text);
@@ -781,35 +1453,37 @@ def generate_html_report(report):
             border-radius: 6px;
             cursor: pointer;
             font-size: 0.8rem;
-        }}
-        .filter-btn:hover {{ border-color: var(--accent); }}
-        .filter-btn.active {{ border-color: var(--accent); background: rgba(255,107,53,0.15); }}
+        }
+        .filter-btn:hover { border-color: var(--accent); }
+        .filter-btn.active { border-color: var(--accent); background: rgba(255,107,53,0.15); }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>OpenClaw QA Report</h1>
-        <p class="subtitle">Generated {now} | Duration: {elapsed} | {overall_badge}</p>
+"""
+
+_REPORT_SUMMARY = Template("""        <p class="subtitle">Generated $now | Duration: $elapsed | $overall_badge</p>
 
         <div class="summary">
             <div class="summary-card total">
-                <div class="number">{report.total}</div>
+                <div class="number">$total</div>
                 <div class="label">Total Checks</div>
             </div>
             <div class="summary-card pass">
-                <div class="number">{report.passed}</div>
+                <div class="number">$passed</div>
                 <div class="label">Passed</div>
             </div>
             <div class="summary-card fail">
-                <div class="number">{report.failed}</div>
+                <div class="number">$failed</div>
                 <div class="label">Failed</div>
             </div>
             <div class="summary-card warn">
-                <div class="number">{report.warnings}</div>
+                <div class="number">$warnings</div>
                 <div class="label">Warnings</div>
             </div>
             <div class="summary-card fixed">
-                <div class="number">{report.fixed}</div>
+                <div class="number">$fixed</div>
                 <div class="label">Auto-Fixed</div>
             </div>
         </div>
@@ -831,7 +1505,9 @@ def generate_html_report(report):
                 </tr>
             </thead>
             <tbody>
-                {''.join(rows)}
+                """)
+
+_REPORT_TAIL = """
             </tbody>
         </table>
 
@@ -841,38 +1517,80 @@ def generate_html_report(report):
     </div>
 
     <script>
-    function filterRows(status) {{
+    function filterRows(status) {
         document.querySelectorAll('.filter-btn').forEach(b => b.classList.remove('active'));
         event.target.classList.add('active');
-        document.querySelectorAll('.result-row').forEach(row => {{
-            if (status === 'all') {{
+        document.querySelectorAll('.result-row').forEach(row => {
+            if (status === 'all') {
                 row.style.display = '';
-            }} else {{
+            } else {
                 row.style.display = row.classList.contains(status) ? '' : 'none';
-            }}
-        }});
-    }}
+            }
+        });
+    }
     </script>
 </body>
 </html>
 """
-    REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    REPORT_FILE.write_text(html, encoding="utf-8")
-    return str(REPORT_FILE)
+
+_REPORT_ROW = Template("""
+        <tr class="result-row $status_class">
+            <td class="status-cell"><span class="badge $status_class">$status</span></td>
+            <td class="name-cell">$name</td>
+            <td class="category-cell">$category</td>
+            <td class="details-cell">$details</td>
+        </tr>""")
+
+
+def generate_html_report(report, path=REPORT_FILE):
+    """Check 9: Generate a styled HTML report page.
+
+    The page is streamed to disk row by row, so memory use does not grow
+    with the number of results.
+    """
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    elapsed = f"{report.elapsed:.1f}s"
+
+    # Status badge
+    if report.all_passed:
+        overall_badge = '<span class="badge pass">ALL PASSED</span>'
+    else:
+        overall_badge = f'<span class="badge fail">{report.failed} FAILED</span>'
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 1 MiB buffer: the streamed pieces reach the disk in one or a few writes
+    with path.open("w", encoding="utf-8", buffering=REPORT_BUFFER) as f:
+        f.write(_REPORT_HEAD)
+        f.write(_REPORT_SUMMARY.substitute(
+            now=now, elapsed=elapsed, overall_badge=overall_badge,
+            total=report.total, passed=report.passed, failed=report.failed,
+            warnings=report.warnings, fixed=report.fixed))
+        for r in report.results:
+            f.write(_report_row(r))
+        f.write(_REPORT_TAIL)
+    return str(path)
+
+
+def _report_row(r):
+    """Render one CheckResult as a report table row."""
+    details_html = "".join(
+        f'<div class="detail {_STATUS_CLASSES[level]}">'
+        f'{_DETAIL_ICONS[level]} {_html_escape(msg)}</div>\n'
+        for level, msg in r.details)
+    return _REPORT_ROW.substitute(
+        status_class=_STATUS_CLASSES[r.status], status=r.status.name, name=_html_escape(r.name),
+        category=_html_escape(r.category), details=details_html)
 
 
 def _html_escape(text):
-    """Simple HTML escaping."""
-    return (text
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;"))
+    """Simple HTML escaping (single pass)."""
+    return text.translate(_HTML_ESCAPE_TABLE)
 
 
 def _natural_sort_key(s):
     """Sort strings with embedded numbers naturally (test-2 before test-10)."""
-    return [int(t) if t.isdigit() else t.lower() for t in re.split(r'(\d+)', s)]
+    return [int(t) if t.isdigit() else t.lower() for t in _NUM_SPLIT_RE.split(s)]
 
 
 # ---------------------------------------------------------------------------
@@ -892,41 +1610,71 @@ def main():
                         help="Generate HTML report at public/clawdbot/qa-report.html")
     parser.add_argument("--quiet", "-q", action="store_true",
                         help="Only show failures and summary")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help=f"Concurrent page checks (default: up to {MAX_JOBS}; "
+                             "keep below ulimit -n)")
+    parser.add_argument("--offline", action="store_true",
+                        help="Skip HTTP: resolve site URLs against public/, don't probe external ones")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Neither read nor write the URL check and page caches "
+                             f"({URL_CACHE_FILE}, {PAGE_CACHE_FILE})")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="Re-check every URL and re-parse every page, then rewrite the caches")
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    global _offline
+    _offline = args.offline
+
+    # Block-buffer the terminal too; output is flushed once per phase below
+    # instead of with every line.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
 
     report = QAReport()
+    workspace = WorkspaceIndex.scan()
+    if not (args.no_cache or args.refresh_cache):
+        load_url_cache()
+        load_page_cache()
 
     print(C.header("OpenClaw QA Check"))
     print(f"  {C.DIM}Workspace: {os.getcwd()}{C.RESET}")
     print(f"  {C.DIM}Base URL:  {BASE_URL}{C.RESET}")
     print(f"  {C.DIM}Options:   fix={args.fix} verbose={args.verbose} report={args.report}{C.RESET}")
-    print()
+    print(flush=True)
 
     # ---- Run all checks ----
 
+    # Page checks dominate the run and only read files, so start them now and
+    # let their I/O overlap phases 1-2. With --fix, index.json repairs and
+    # placeholders must land in order, so everything stays sequential.
+    pending_pages = None
+    if not args.fix and workspace.exists:
+        pending_pages = start_page_checks(args.verbose, args.fix, args.jobs, workspace)
+
     # 6. Main index
-    print(f"{C.BOLD}[1/4] Checking main index...{C.RESET}")
+    print(f"{C.BOLD}[1/4] Checking main index...{C.RESET}", flush=True)
     r = check_main_index(report, args.verbose)
     if not args.quiet:
         _print_result(r, args.verbose)
 
     # 2. index.json
-    print(f"\n{C.BOLD}[2/4] Validating index.json...{C.RESET}")
-    r = check_index_json(report, args.verbose, args.fix)
+    print(f"\n{C.BOLD}[2/4] Validating index.json...{C.RESET}", flush=True)
+    r = check_index_json(report, args.verbose, args.fix, workspace)
     if not args.quiet:
         _print_result(r, args.verbose)
 
     # 1, 3, 4, 5, 7. Project pages
-    print(f"\n{C.BOLD}[3/4] Checking project pages...{C.RESET}")
-    page_results = check_project_pages(report, args.verbose, args.fix)
-    for r in page_results:
-        if args.quiet and r.passed:
-            continue
-        _print_result(r, args.verbose)
+    print(f"\n{C.BOLD}[3/4] Checking project pages...{C.RESET}", flush=True)
+    page_results = check_project_pages(report, args.verbose, args.fix, args.jobs, workspace,
+                                       pending_pages)
+    sys.stdout.write("".join(_format_result(r, args.verbose) for r in page_results
+                             if not (args.quiet and r.passed)))
 
     # 9. Generate report
     if args.report:
-        print(f"\n{C.BOLD}[4/4] Generating HTML report...{C.RESET}")
+        print(f"\n{C.BOLD}[4/4] Generating HTML report...{C.RESET}", flush=True)
         report.finalize()
         path = generate_html_report(report)
         print(f"  {C.ok(f'Report written to {path}')}")
@@ -934,6 +1682,10 @@ def main():
         report.finalize()
         print(f"\n  {C.DIM}[4/4] Skipping HTML report (use --report to generate){C.RESET}")
 
+    if not args.no_cache:
+        save_url_cache()
+        save_page_cache()
+
     # ---- Summary ----
     print(C.header("Summary"))
     print(f"  Total checks:  {report.total}")
@@ -954,30 +1706,27 @@ def main():
         if not args.fix:
             print(f"  {C.DIM}Tip: Run with --fix to auto-repair common issues{C.RESET}")
 
-    print()
+    print(flush=True)
 
     # 10. Exit code
     return 0 if report.all_passed else 1
 
 
-def _print_result(result, verbose):
-    """Print a single check result to terminal."""
-    status_map = {
-        "PASS":  C.ok,
-        "FAIL":  C.fail,
-        "WARN":  C.warn,
-        "FIXED": lambda m: f"{C.BLUE}FIXD{C.RESET} {m}",
-    }
-    printer = status_map.get(result.status, C.info)
-    print(f"  {printer(result.name)}")
-    if verbose or result.status in ("FAIL", "FIXED"):
+def _format_result(result, verbose):
+    """Render a single check result as terminal lines."""
+    printer = _STATUS_PRINTERS[result.status]
+    lines = [f"  {printer(result.name)}\n"]
+    if verbose or result.status in (Status.FAIL, Status.FIXED):
         for level, msg in result.details:
             indent = "      "
-            color = {
-                "PASS": C.GREEN, "FAIL": C.RED, "WARN": C.YELLOW,
-                "FIXED": C.BLUE, "INFO": C.DIM
-            }.get(level, "")
-            print(f"{indent}{color}{level}: {msg}{C.RESET}")
+            color = _DETAIL_COLORS[level]
+            lines.append(f"{indent}{color}{level.name}: {msg}{C.RESET}\n")
+    return "".join(lines)
+
+
+def _print_result(result, verbose):
+    """Print a single check result to terminal."""
+    sys.stdout.write(_format_result(result, verbose))
 
 
 if __name__ == "__main__":